@@ -92,7 +92,7 @@ def extract_ocr_from_image(
         image_save_path = tmp_file.name
         pil_image.save(image_save_path)
     
-    logger.info(f"Temporary image saved to {image_save_path}")
+    logger.info("Temporary image saved to %s", image_save_path)
 
     try:
         # Calculate draw_bbox_config, assuming it's needed by get_som_labeled_img
@@ -121,7 +121,7 @@ def extract_ocr_from_image(
             use_paddleocr=use_paddleocr
         )
         text, ocr_bbox = ocr_bbox_rslt
-        logger.info(f"Raw OCR text extracted (first 50 chars): {text[:50]}")
+        logger.info("Raw OCR text extracted (first 50 chars): %s", text[:50])
 
         # Get structured labeled image data (we only need the parsed content list)
         _, _, parsed_content_list = get_som_labeled_img(
@@ -141,7 +141,7 @@ def extract_ocr_from_image(
             f"icon {i}: {json.dumps(item, ensure_ascii=False) if isinstance(item, (dict, list)) else str(item)}"
             for i, item in enumerate(parsed_content_list)
         )
-        logger.info(f"Content parsing successful. Found {len(parsed_content_list)} items.")
+        logger.info("Content parsing successful. Found %d items.", len(parsed_content_list))
         return parsed_text_output
 
     except Exception as e:
@@ -152,7 +152,7 @@ def extract_ocr_from_image(
         if os.path.exists(image_save_path):
             try:
                 os.remove(image_save_path)
-                logger.info(f"Temporary image {image_save_path} removed.")
+                logger.info("Temporary image %s removed.", image_save_path)
             except Exception as e_rem:
                 logger.error(f"Error removing temporary image {image_save_path}: {e_rem}")
 
@@ -179,7 +179,7 @@ def ocr_endpoint():
         pil_image = Image.open(io.BytesIO(image_bytes))
         # It's good practice to ensure a consistent format, e.g., RGB
         pil_image = pil_image.convert("RGB")
-        logger.info(f"API /ocr: Received image '{file.filename}', size: {pil_image.size}, mode: {pil_image.mode}")
+        logger.info("API /ocr: Received image '%s', size: %s, mode: %s", file.filename, pil_image.size, pil_image.mode)
 
     except Exception as e:
         logger.error(f"API /ocr: Invalid image file provided. Error: {e}", exc_info=True)
@@ -193,7 +193,7 @@ def ocr_endpoint():
         use_paddleocr_str = request.form.get('use_paddleocr', 'true').lower()
         use_paddleocr = use_paddleocr_str == 'true'
         imgsz = int(request.form.get('imgsz', 640))
-        logger.info(f"API /ocr: Processing with params: box_threshold={box_threshold}, iou_threshold={iou_threshold}, use_paddleocr={use_paddleocr}, imgsz={imgsz}")
+        logger.info("API /ocr: Processing with params: box_threshold=%s, iou_threshold=%s, use_paddleocr=%s, imgsz=%s", box_threshold, iou_threshold, use_paddleocr, imgsz)
     except ValueError as e:
         logger.error(f"API /ocr: Invalid parameter value. Error: {e}", exc_info=True)
         return jsonify({"error": f"Invalid parameter value: {str(e)}"}), 400